@@ -0,0 +1,193 @@
+import heapq
+
+from demofile import Demofile, MIN_DISTANCE, MIN_ROTATION_DEG, NYQUIST_FACTOR, calculate_rotation, distance_between_points
+from resample import interpolate_sample
+
+# Objects every demofile uses besides its waypoints: the platform, the player
+# actor, and the rotate commit() adds to face the start again
+FIXED_OBJECT_COUNT = 3
+
+# Room left for the final sample commit() adds: a waypoint, a rotate and a timer
+FINAL_SAMPLE_OBJECT_COUNT = 3
+
+# How many units of position error one degree of rotation error is worth
+ROTATION_ERROR_WEIGHT = 1/30
+
+class BudgetedDemofile:
+    # Records like Demofile, but never uses more than object_budget objects.
+    # Once the budget is reached, the waypoint whose removal changes the
+    # playback the least is merged into its neighbours to make room. Only the
+    # kept samples are stored, so each sample costs O(log n) in the number kept
+    # no matter how long the recording runs.
+    def __init__(self, sample_rate, filepath, world_name, room_name, object_budget):
+        self.filepath = filepath
+        self.world_name = world_name
+        self.room_name = room_name
+        self.sample_rate = sample_rate
+        self.object_budget = object_budget
+        self.verbose = True
+
+        # The kept samples by index, linked in order. Merged ones are removed.
+        self.samples = dict()
+        self.prev = dict()
+        self.next = dict()
+        self.costs = dict()
+        self.versions = dict()
+
+        # The most the playback strays from the merged samples between each
+        # kept sample and the next one
+        self.span_errors = dict()
+
+        self.first = None
+        self.last = None
+        self.next_index = 0
+
+        self.count = FIXED_OBJECT_COUNT
+        self.merges = 0
+        self.heap = list()
+
+    def object_count(self):
+        return self.count
+
+    def _cost(self, i):
+        # The same objects Demofile.process_sample creates for this sample
+        p = self.prev[i]
+        if p is None:
+            return 1
+
+        (_, prev_pos, prev_rot) = self.samples[p]
+        (_, pos, rot) = self.samples[i]
+
+        cost = 1
+        if abs(calculate_rotation(prev_rot, rot)) >= MIN_ROTATION_DEG:
+            cost += 1
+        if distance_between_points(prev_pos, pos) < MIN_DISTANCE:
+            cost += 1
+        return cost
+
+    def _error(self, i):
+        # How far the playback strays if this sample is merged away. Dropping it
+        # moves the path by at most its own error anywhere between the neighbours,
+        # so that's added to what the two spans already stray, which keeps
+        # repeated merges in one region from looking free.
+        p = self.prev[i]
+        n = self.next[i]
+
+        (time, pos, rot) = self.samples[i]
+        (_, interp_pos, interp_rot) = interpolate_sample(self.samples[p], self.samples[n], time)
+
+        pos_error = distance_between_points(pos, interp_pos)
+        rot_error = abs(calculate_rotation(interp_rot, rot))
+        return pos_error + rot_error*ROTATION_ERROR_WEIGHT + max(self.span_errors[p], self.span_errors[i])
+
+    def _push(self, i):
+        # Only samples between two others can be merged, the first and latest stay put
+        self.versions[i] += 1
+        if self.prev[i] is not None and self.next[i] is not None:
+            heapq.heappush(self.heap, (self._error(i), i, self.versions[i]))
+
+    def _merge(self):
+        while self.heap:
+            (error, i, version) = heapq.heappop(self.heap)
+            if version == self.versions.get(i):
+                break
+        else:
+            raise Exception("Nothing left to merge, the room can't fit this recording")
+
+        p = self.prev[i]
+        n = self.next[i]
+        self.next[p] = n
+        self.prev[n] = p
+        self.span_errors[p] = error
+
+        self.count -= self.costs[i] + self.costs[n]
+        for samples in (self.samples, self.prev, self.next, self.costs, self.versions, self.span_errors):
+            del samples[i]
+        self.costs[n] = self._cost(n)
+        self.count += self.costs[n]
+        self.merges += 1
+
+        self._push(p)
+        self._push(n)
+
+        # Drop the outdated entries once they outnumber the live ones
+        if len(self.heap) > 2*len(self.samples):
+            self.heap = [entry for entry in self.heap if entry[2] == self.versions.get(entry[1])]
+            heapq.heapify(self.heap)
+
+    def _fit(self, object_budget):
+        while self.count > object_budget:
+            self._merge()
+
+    def process_sample(self, sample, force=False):
+        (time, pos, rot) = sample
+
+        if self.last is not None:
+            (last_time, last_pos, last_rot) = self.samples[self.last]
+
+            # Skip faster than nyquist
+            if time - last_time < 1/(self.sample_rate*NYQUIST_FACTOR):
+                return
+
+            if not force and distance_between_points(last_pos, pos) < MIN_DISTANCE and abs(calculate_rotation(last_rot, rot)) < MIN_ROTATION_DEG:
+                return # The player stood still
+
+        i = self.next_index
+        self.next_index += 1
+        self.samples[i] = (time, (pos[0], pos[1], pos[2]), rot)
+        self.prev[i] = self.last
+        self.next[i] = None
+        self.versions[i] = 0
+        self.span_errors[i] = 0
+
+        if self.last is not None:
+            self.next[self.last] = i
+        else:
+            self.first = i
+        self.costs[i] = self._cost(i)
+        self.count += self.costs[i]
+
+        # The previous latest sample now has neighbours on both sides
+        if self.last is not None:
+            self._push(self.last)
+        self.last = i
+
+        self._fit(self.object_budget - FINAL_SAMPLE_OBJECT_COUNT)
+
+        if self.verbose:
+            print(f"{time:.1f}: ({pos[0]:.1f}, {pos[1]:.1f}, {pos[2]:.1f}, {rot:.1f}) [{self.count}/{self.object_budget} objects]")
+
+    def _kept_samples(self):
+        samples = list()
+        i = self.first
+        while i is not None:
+            samples.append(self.samples[i])
+            i = self.next[i]
+        return samples
+
+    def _encode(self, final_sample):
+        demofile = Demofile(self.sample_rate, self.filepath, self.world_name, self.room_name)
+        demofile.verbose = False
+
+        for sample in self._kept_samples():
+            demofile.process_sample(sample)
+        demofile.process_sample(final_sample, force=True)
+
+        return demofile
+
+    def commit(self, final_sample, **kwargs):
+        demofile = self._encode(final_sample)
+
+        # The object counts are estimated while recording, if the real encoding
+        # comes out larger then merge away the difference and encode again.
+        # commit() adds one more object, the rotate back to the start.
+        while (overshoot := demofile.object_count() + 1 - self.object_budget) > 0:
+            self._fit(self.count - overshoot)
+            demofile = self._encode(final_sample)
+
+        if self.merges:
+            print(f"Merged {self.merges} samples to fit '{self.world_name}:{self.room_name}'")
+
+        # The final sample was already added above, committing it again is a no-op
+        demofile.commit(final_sample, **kwargs)
+        return demofile
@@ -1,9 +1,32 @@
 from math import sqrt
 import os
 import json
+import gzip
 
 INSTANCE_ID_RANGE_START = 9_000_000
 
+# Samples closer together than this fraction of the sample period are skipped
+NYQUIST_FACTOR = 2
+
+# Movement and turns smaller than these are treated as standing still
+MIN_DISTANCE = 0.1
+MIN_ROTATION_DEG = 0.5
+
+# The fields of each object type which hold floats, used to round the output
+# without walking every value in the document
+FLOAT_FIELDS = {
+    "waypoints": ("position", "speed"),
+    "actorRotates": ("rotation", "timeScale"),
+    "platforms": ("position",),
+    "playerActors": ("position", "rotation"),
+    "timers": ("time",),
+}
+
+COMPRESSED_EXTENSIONS = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
 def calculate_rotation(last, next):
     clockwise = (next - last) % 360
     counter_clockwise = (last - next) % 360
@@ -18,6 +41,65 @@ def distance_between_points(p1, p2):
     x2, y2, z2 = p2
     return sqrt((x2 - x1)**2 + (y2 - y1)**2 + (z2 - z1)**2)
 
+def _round_field(value, precision):
+    if isinstance(value, list):
+        return [round(x, precision) for x in value]
+    return round(value, precision)
+
+def _round_room(room, precision):
+    rounded = dict()
+    for key, objects in room.items():
+        fields = FLOAT_FIELDS.get(key)
+        if not fields:
+            # Nothing to round, reuse the list as-is
+            rounded[key] = objects
+            continue
+
+        rounded[key] = [
+            {
+                field: _round_field(value, precision) if field in fields else value
+                for (field, value) in obj.items()
+            }
+            for obj in objects
+        ]
+
+    return rounded
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise Exception("zstd compression requires the 'zstandard' package")
+    return zstandard
+
+def _compress(contents, compression):
+    if compression == "gzip":
+        return gzip.compress(contents)
+
+    if compression == "zstd":
+        return _zstandard().ZstdCompressor().compress(contents)
+
+    raise Exception(f"Unknown compression '{compression}'")
+
+def _decompress(contents, compression):
+    if compression == "gzip":
+        return gzip.decompress(contents)
+
+    if compression == "zstd":
+        return _zstandard().ZstdDecompressor().decompress(contents)
+
+    raise Exception(f"Unknown compression '{compression}'")
+
+def read_demofile(filepath):
+    with open(filepath, 'rb') as file:
+        contents = file.read()
+
+    for (compression, extension) in COMPRESSED_EXTENSIONS.items():
+        if filepath.endswith(extension):
+            contents = _decompress(contents, compression)
+
+    return json.loads(contents)
+
 class Demofile:
     def __init__(self, sample_rate, filepath, world_name, room_name):
         self.filepath = filepath
@@ -25,6 +107,9 @@ class Demofile:
         self.room_name = room_name
         self.sample_rate = sample_rate
 
+        # Print each saved sample as it's processed
+        self.verbose = True
+
         self.last_save_time = None
         self.last_save_pos = None
         self.last_save_rot = None
@@ -34,6 +119,9 @@ class Demofile:
         self.platform_id = None
         self.player_actor_id = None
 
+        # The rate a loaded demofile appears to have been recorded at, see load()
+        self.recorded_sample_rate = None
+
         self.data = dict()
         self.data["waypoints"] = list()
         self.data["actorRotates"] = list()
@@ -42,6 +130,83 @@ class Demofile:
         self.data["timers"] = list()
         self.data["addConnections"] = list()
 
+    @classmethod
+    def load(cls, sample_rate, filepath):
+        data = read_demofile(filepath)
+
+        # A demofile only ever contains the one room it was recorded in
+        ((world_name, world),) = data["levelData"].items()
+        ((room_name, room),) = world["rooms"].items()
+
+        # A compressed sidecar resumes into the uncompressed demofile beside it
+        for extension in COMPRESSED_EXTENSIONS.values():
+            if filepath.endswith(extension):
+                filepath = filepath[:-len(extension)]
+
+        demofile = cls(sample_rate, filepath, world_name, room_name)
+        for key in demofile.data:
+            demofile.data[key] = room.get(key, list())
+
+        waypoints = demofile.data["waypoints"]
+        actor_rotates = demofile.data["actorRotates"]
+        connections = demofile.data["addConnections"]
+        assert len(waypoints) > 1
+
+        first_waypoint = waypoints[0]["id"]
+        last_waypoint = waypoints[-1]["id"]
+        demofile.platform_id = demofile.data["platforms"][0]["id"]
+        demofile.player_actor_id = demofile.data["playerActors"][0]["id"]
+
+        # Strip everything commit() appended to close the loop, those objects
+        # are always the last ones written so only the tail needs inspecting
+        final_rotate = actor_rotates.pop()
+        loop_connections = [
+            {
+                "senderId": last_waypoint,
+                "state": "ARRIVED",
+                "targetId": first_waypoint,
+                "message": "NEXT",
+            },
+            {
+                "senderId": last_waypoint,
+                "state": "ARRIVED",
+                "targetId": final_rotate["id"],
+                "message": "ACTION",
+            },
+            {
+                "senderId": final_rotate["id"],
+                "state": "PLAY",
+                "targetId": demofile.player_actor_id,
+                "message": "PLAY",
+            },
+        ]
+
+        if connections[-2:] != loop_connections[1:]:
+            raise Exception(f"'{filepath}' does not end with the rotation written by commit")
+        del connections[-2:]
+
+        while connections[-1]["message"] == "DEACTIVATE" and connections[-1]["senderId"] == last_waypoint:
+            connections.pop()
+        if connections.pop() != loop_connections[0]:
+            raise Exception(f"'{filepath}' does not end with the connections written by commit")
+
+        # The final rotate was the last id handed out, so it can be reused
+        demofile.next_instance_id = final_rotate["id"]
+        demofile.last_waypoint = last_waypoint
+        demofile.last_save_pos = waypoints[-1]["position"]
+
+        # The final rotate turned the player from their last rotation back to the start
+        start_rot_deg = demofile.data["playerActors"][0]["rotation"][2]
+        demofile.last_save_rot = (start_rot_deg - final_rotate["rotation"][2]) % 360
+
+        # The sample rate isn't saved, but every rotate and pause lasts a whole
+        # number of samples so the shortest one gives it away
+        durations = [rotate["timeScale"] for rotate in actor_rotates] + [timer["time"] for timer in demofile.data["timers"]]
+        durations = [duration for duration in durations if duration > 0]
+        demofile.recorded_sample_rate = 1/min(durations) if durations else None
+
+        return demofile
+
     def object_count(self):
         return self.next_instance_id - INSTANCE_ID_RANGE_START
 
@@ -59,22 +224,27 @@ class Demofile:
             delta_time = time - self.last_save_time
 
             # Skip faster than nyquist
-            if delta_time < 1/(self.sample_rate*2):
+            if delta_time < 1/(self.sample_rate*NYQUIST_FACTOR):
                 return
 
         # Calculate delta-distance, the space covered to reach this location
         delta_distance = None
         if self.last_save_pos is not None:
             delta_distance = distance_between_points(self.last_save_pos, pos)
-            if delta_distance < 0.1:
+            if delta_distance < MIN_DISTANCE:
                 delta_distance = None
 
+        # Resumed from a loaded demofile, there's no game time to compare against
+        # so bridge the gap to this location at the chain's starting speed
+        if delta_time is None and self.last_waypoint:
+            delta_time = max((delta_distance or 0)/30, 1/self.sample_rate)
+
         # Calculate delta-rotation, the amount the player rotated while moving to this location
         actor_rotate_id = None
         delta_rot_deg = None
         if self.last_save_rot is not None:
             delta_rot_deg = calculate_rotation(self.last_save_rot, rot)
-            if abs(delta_rot_deg) < 0.5:
+            if abs(delta_rot_deg) < MIN_ROTATION_DEG:
                 delta_rot_deg = None
                 actor_rotate_id = None
             else:
@@ -234,9 +404,10 @@ class Demofile:
         if self.last_save_rot is None or delta_rot_deg:
             self.last_save_rot = rot
 
-        print(f"{time:.1f}: ({pos[0]:.1f}, {pos[1]:.1f}, {pos[2]:.1f}, {rot:.1f})")
+        if self.verbose:
+            print(f"{time:.1f}: ({pos[0]:.1f}, {pos[1]:.1f}, {pos[2]:.1f}, {rot:.1f})")
 
-    def commit(self, final_sample):
+    def commit(self, final_sample, compact=False, precision=None, compression=None):
         self.process_sample(final_sample, force=True)
         assert len(self.data["waypoints"]) > 1
         first_waypoint = self.data["waypoints"][0]["id"]
@@ -344,7 +515,7 @@ class Demofile:
             "levelData": {
                 self.world_name: {
                     "rooms": {
-                        self.room_name: self.data,
+                        self.room_name: self.data if precision is None else _round_room(self.data, precision),
                     },
                 },
             },
@@ -354,7 +525,21 @@ class Demofile:
         if directory:
             os.makedirs(directory, exist_ok=True)
 
+        if compact:
+            # Sorted keys keep the output stable for diffs
+            contents = json.dumps(data, separators=(',', ':'), sort_keys=True)
+        else:
+            contents = json.dumps(data)
+
         with open(self.filepath, 'w') as file:
-            file.write(json.dumps(data))
+            file.write(contents)
 
         print(f"Saved recording to '{self.filepath}' (Used {self.object_count()} objects)")
+
+        if compression:
+            compressed = _compress(contents.encode(), compression)
+            sidecar_filepath = self.filepath + COMPRESSED_EXTENSIONS[compression]
+            with open(sidecar_filepath, 'wb') as file:
+                file.write(compressed)
+
+            print(f"Saved compressed recording to '{sidecar_filepath}'")
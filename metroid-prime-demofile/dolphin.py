@@ -1,9 +1,34 @@
 import math
+import struct
 
 import dolphin_memory_engine
 
 dolphin = dolphin_memory_engine
 
+# Swap in another object with dolphin_memory_engine's interface, e.g. a simulated Dolphin
+def use_backend(backend):
+    global dolphin
+    dolphin = backend
+
+# Pointer chains, each pointer is dereferenced then offset by the following value
+GAME_TIME = (0x804578CC, 0xA0)
+PLAYER_POS_X = (0x80458350, 0x40)
+PLAYER_POS_Y = (0x80458350, 0x50)
+PLAYER_POS_Z = (0x80458350, 0x60)
+PLAYER_ROT_X = (0x80458350, 0x500)
+PLAYER_ROT_Y = (0x80458350, 0x510)
+WORLD_MLVL = (0x8045A1A8 + 0x850, 0x8)
+WORLD_AREA_IDX = (0x8045A1A8 + 0x850, 0x68)
+
+FORMATS = {
+    "word": ">I",
+    "float": ">f",
+    "double": ">d",
+}
+
+# Reads closer together than this are fetched with a single round-trip
+MAX_READ_GAP = 0x400
+
 def connect():
     dolphin.un_hook()
     dolphin.hook()
@@ -32,7 +57,7 @@ def _deref(ptr, offset):
     return addr + offset
 
 def _read_time():
-    addr = _deref(0x804578CC, 0xA0)
+    addr = _deref(*GAME_TIME)
     return dolphin.read_double(addr)
 
 def _cplayer_helper(offset):
@@ -48,7 +73,9 @@ def _read_pos():
 def _read_rot():
     x = _cplayer_helper(0x500)
     y = _cplayer_helper(0x510)
+    return rotation_from_vector(x, y)
 
+def rotation_from_vector(x, y):
     rot_rad = math.atan2(y, x)
     rot_deg = math.degrees(rot_rad)
     rot_deg += 270
@@ -82,3 +109,46 @@ def take_sample():
         raise Exception("Unable to read memory")
 
     return (time, pos, rot)
+
+def _read_batch(reads):
+    # Merge nearby reads into spans so each span costs one call into Dolphin
+    spans = list()
+    for (addr, kind) in sorted(reads):
+        end = addr + struct.calcsize(FORMATS[kind])
+        if spans and addr - spans[-1][1] <= MAX_READ_GAP:
+            spans[-1][1] = max(spans[-1][1], end)
+            spans[-1][2].append((addr, kind))
+        else:
+            spans.append([addr, end, [(addr, kind)]])
+
+    values = dict()
+    for (start, end, span_reads) in spans:
+        memory = dolphin.read_bytes(start, end - start)
+        for (addr, kind) in span_reads:
+            (values[(addr, kind)],) = struct.unpack_from(FORMATS[kind], memory, addr - start)
+
+    return values
+
+# Read many (pointer chain, kind) fields, sharing pointer and memory reads between them.
+# The connection isn't probed first, that would cost a round-trip on every call, a lost
+# connection shows up as the reads themselves failing.
+def read_fields(fields):
+    try:
+        return _read_fields(fields)
+    except RuntimeError:
+        dolphin.un_hook()
+        raise Exception("Connection lost")
+
+def _read_fields(fields):
+    addresses = [chain[0] for (chain, kind) in fields]
+    depth = max(len(chain) for (chain, kind) in fields)
+
+    # Follow every chain one level at a time so shared pointers are only read once
+    for level in range(1, depth):
+        following = [i for (i, (chain, kind)) in enumerate(fields) if len(chain) > level]
+        pointers = _read_batch({(addresses[i], "word") for i in following})
+        for i in following:
+            addresses[i] = pointers[(addresses[i], "word")] + fields[i][0][level]
+
+    values = _read_batch({(addr, kind) for (addr, (chain, kind)) in zip(addresses, fields)})
+    return [values[(addr, kind)] for (addr, (chain, kind)) in zip(addresses, fields)]
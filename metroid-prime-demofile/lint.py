@@ -0,0 +1,262 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+import argparse
+import json
+import os
+import re
+import sys
+
+from demofile import INSTANCE_ID_RANGE_START, read_demofile
+from rooms import catalog
+
+# Written for this repo, it only describes the fields Demofile.commit writes. It isn't
+# randomprime's own schema, so passing it doesn't promise randomprime accepts the file.
+SCHEMA_FILEPATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "demofile.schema.json")
+
+TYPE_CHECKS = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+OBJECT_LISTS = ("waypoints", "actorRotates", "platforms", "playerActors", "timers")
+
+def _compile(schema, root, compiled_refs):
+    # Turn a (sub)schema into a list of checks, each check takes a value and a
+    # path and yields problems. Only the keywords demofile.schema.json uses are supported.
+    if "$ref" in schema:
+        ref = schema["$ref"]
+        if ref not in compiled_refs:
+            # Refs may be recursive, fill the entry in once compiled
+            checks = list()
+            compiled_refs[ref] = checks
+            target = root
+            for part in ref.lstrip("#/").split("/"):
+                target = target[part]
+            checks.extend(_compile(target, root, compiled_refs))
+        return compiled_refs[ref]
+
+    checks = list()
+
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        type_checks = [TYPE_CHECKS[t] for t in types]
+        def check_type(value, path):
+            if not any(type_check(value) for type_check in type_checks):
+                yield f"{path}: expected {' or '.join(types)}, got {json.dumps(value)[:40]}"
+        checks.append(check_type)
+
+    if "enum" in schema:
+        enum = schema["enum"]
+        def check_enum(value, path):
+            if value not in enum:
+                yield f"{path}: {json.dumps(value)} is not one of {enum}"
+        checks.append(check_enum)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+        def check_pattern(value, path):
+            if isinstance(value, str) and not pattern.search(value):
+                yield f"{path}: '{value}' does not match '{pattern.pattern}'"
+        checks.append(check_pattern)
+
+    if "minimum" in schema or "maximum" in schema:
+        minimum = schema.get("minimum", float("-inf"))
+        maximum = schema.get("maximum", float("inf"))
+        def check_range(value, path):
+            if TYPE_CHECKS["number"](value) and not (minimum <= value <= maximum):
+                yield f"{path}: {value} is out of range"
+        checks.append(check_range)
+
+    if "minItems" in schema or "maxItems" in schema:
+        min_items = schema.get("minItems", 0)
+        max_items = schema.get("maxItems", float("inf"))
+        def check_length(value, path):
+            if isinstance(value, list) and not (min_items <= len(value) <= max_items):
+                yield f"{path}: expected between {min_items} and {max_items} items, got {len(value)}"
+        checks.append(check_length)
+
+    if "items" in schema:
+        item_checks = _compile(schema["items"], root, compiled_refs)
+        def check_items(value, path):
+            if isinstance(value, list):
+                for (i, item) in enumerate(value):
+                    yield from _run(item_checks, item, f"{path}[{i}]")
+        checks.append(check_items)
+
+    if "required" in schema:
+        required = schema["required"]
+        def check_required(value, path):
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        yield f"{path}: missing '{key}'"
+        checks.append(check_required)
+
+    properties = {
+        key: _compile(subschema, root, compiled_refs)
+        for (key, subschema) in schema.get("properties", {}).items()
+    }
+    additional = schema.get("additionalProperties", True)
+    additional_checks = _compile(additional, root, compiled_refs) if isinstance(additional, dict) else None
+    if properties or additional is not True:
+        def check_properties(value, path):
+            if not isinstance(value, dict):
+                return
+            for (key, item) in value.items():
+                if key in properties:
+                    yield from _run(properties[key], item, f"{path}.{key}")
+                elif additional_checks is not None:
+                    yield from _run(additional_checks, item, f"{path}.{key}")
+                elif additional is False:
+                    yield f"{path}: unexpected '{key}'"
+        checks.append(check_properties)
+
+    return checks
+
+def _run(checks, value, path):
+    for check in checks:
+        yield from check(value, path)
+
+# Compiled once per process, then reused for every file it checks
+@cache
+def validator(schema_filepath=SCHEMA_FILEPATH):
+    with open(schema_filepath, 'r') as file:
+        schema = json.load(file)
+
+    checks = _compile(schema, schema, dict())
+    return lambda data: list(_run(checks, data, "$"))
+
+def _check_graph(room):
+    problems = list()
+
+    ids = set()
+    for key in OBJECT_LISTS:
+        for obj in room.get(key, ()):
+            if "id" not in obj:
+                continue
+            if obj["id"] in ids:
+                problems.append(f"{key}: duplicate id {obj['id']}")
+            ids.add(obj["id"])
+
+    connections = room.get("addConnections", ())
+    for connection in connections:
+        # Ids below the demofile's range belong to the vanilla room and can't be checked offline
+        for key in ("senderId", "targetId"):
+            id = connection.get(key)
+            if isinstance(id, int) and id >= INSTANCE_ID_RANGE_START and id not in ids:
+                problems.append(f"addConnections: dangling {key} {id}")
+
+    waypoints = [waypoint["id"] for waypoint in room.get("waypoints", ()) if "id" in waypoint]
+    platforms = {platform.get("id") for platform in room.get("platforms", ())}
+
+    starts = [
+        connection.get("targetId") for connection in connections
+        if connection.get("senderId") in platforms and connection.get("message") == "FOLLOW"
+    ]
+    if not starts:
+        problems.append("No platform FOLLOWs a waypoint")
+        return problems
+
+    # Waypoints are reached by NEXT from the previous waypoint, or ACTIVATE from a pause timer
+    edges = dict()
+    next_waypoint = dict()
+    for connection in connections:
+        if connection.get("message") in ("NEXT", "ACTIVATE"):
+            edges.setdefault(connection.get("senderId"), list()).append(connection.get("targetId"))
+        if connection.get("message") == "NEXT":
+            next_waypoint.setdefault(connection.get("senderId"), list()).append(connection.get("targetId"))
+
+    reached = set()
+    pending = list(starts)
+    while pending:
+        id = pending.pop()
+        if id in reached:
+            continue
+        reached.add(id)
+        pending.extend(edges.get(id, ()))
+
+    unreachable = [id for id in waypoints if id not in reached]
+    if unreachable:
+        problems.append(f"{len(unreachable)} waypoints are unreachable from the platform, e.g. {unreachable[0]}")
+
+    # Following NEXT from the first waypoint should visit every waypoint and come back around
+    start = starts[0]
+    visited = set()
+    id = start
+    while True:
+        targets = next_waypoint.get(id, ())
+        if len(targets) != 1:
+            problems.append(f"Waypoint {id} has {len(targets)} NEXT connections, expected 1")
+            break
+        visited.add(id)
+        id = targets[0]
+        if id == start:
+            break
+        if id in visited:
+            problems.append(f"Waypoint chain loops back to {id} instead of the first waypoint {start}")
+            break
+
+    return problems
+
+def _check_budget(world_name, room_name, room):
+    object_count = sum(len(room.get(key, ())) for key in OBJECT_LISTS)
+
+    rooms = catalog().rooms_named(world_name, room_name)
+    if not rooms:
+        return [f"Unknown room '{world_name}:{room_name}'"]
+
+    # Rooms sharing a name can't be told apart here, only flag what fits neither
+    object_budget = max(candidate.object_budget for candidate in rooms)
+    if object_count > object_budget:
+        return [f"Uses {object_count} objects, '{world_name}:{room_name}' only has room for {object_budget}"]
+
+    return []
+
+def lint(filepath):
+    try:
+        data = read_demofile(filepath)
+    except Exception as e:
+        return [f"Unable to read: {e}"]
+
+    problems = validator()(data)
+    if problems:
+        # The graph checks assume the structure is valid
+        return problems
+
+    room_count = 0
+    for (world_name, world) in data["levelData"].items():
+        for (room_name, room) in world["rooms"].items():
+            problems.extend(_check_graph(room))
+            problems.extend(_check_budget(world_name, room_name, room))
+            room_count += 1
+
+    if not room_count:
+        problems.append("No rooms recorded")
+
+    return problems
+
+def lint_files(filepaths, jobs=None):
+    if len(filepaths) == 1:
+        return {filepaths[0]: lint(filepaths[0])}
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return dict(zip(filepaths, executor.map(lint, filepaths, chunksize=8)))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check demofiles for problems before handing them to randomprime")
+    parser.add_argument("filepaths", nargs="+")
+    parser.add_argument("--jobs", type=int, default=None, help="Number of files to check in parallel, defaults to the CPU count")
+    args = parser.parse_args()
+
+    failed = False
+    for (filepath, problems) in lint_files(args.filepaths, args.jobs).items():
+        for problem in problems:
+            print(f"{filepath}: {problem}")
+        failed = failed or bool(problems)
+
+    sys.exit(1 if failed else 0)
@@ -3,20 +3,26 @@ import threading
 from datetime import datetime
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 
 from dolphin import connect, disconnect, get_room, take_sample
 from demofile import Demofile
-from rooms import *
+from budget import BudgetedDemofile
+from resample import Resampler
+from rooms import catalog
 
 # Config #
 DEFAULT_SAMPLE_RATE = 10
-OBJECT_COUNT_OVERHEAD = 128
+COMPACT_FLOAT_PRECISION = 3
+COMPACT_COMPRESSION = "gzip"
 
 class MetroidPrimeDemofileGUI:
     def __init__(self, root):
         self.root = root
         self.sample_rate_hz = tk.IntVar(value=DEFAULT_SAMPLE_RATE)
+        self.compact_output = tk.BooleanVar(value=False)
+        self.degrade_when_full = tk.BooleanVar(value=False)
+        self.resample_samples = tk.BooleanVar(value=True)
         self.recording = False
         self.record_thread = None
         self.object_count_var = tk.StringVar(value="Objects Remaining")
@@ -33,6 +39,9 @@ class MetroidPrimeDemofileGUI:
         sample_rate_options = [0.5, 1, 2, 3, 5, 10, 15, 20]
         tk.Label(self.root, text="Sample Rate (Hz)").pack()
         ttk.Combobox(self.root, textvariable=self.sample_rate_hz, values=sample_rate_options, state="readonly").pack()
+        tk.Checkbutton(self.root, text="Compact Output", variable=self.compact_output).pack()
+        tk.Checkbutton(self.root, text="Simplify Instead of Stopping When Out of Objects", variable=self.degrade_when_full).pack()
+        tk.Checkbutton(self.root, text="Resample to Even Game Time Steps", variable=self.resample_samples).pack()
 
         tk.Label(self.root, textvariable=self.object_count_var).pack(pady=10)
         tk.Label(self.root, textvariable=self.recording_done_var).pack(pady=10)
@@ -40,31 +49,53 @@ class MetroidPrimeDemofileGUI:
         self.start_button = tk.Button(self.root, text="Start Recording", command=self.start_recording)
         self.start_button.pack(pady=5)
 
+        self.resume_button = tk.Button(self.root, text="Resume Recording", command=self.resume_recording)
+        self.resume_button.pack(pady=5)
+
         self.stop_button = tk.Button(self.root, text="Stop Recording", command=self.stop_recording)
 
-    def record(self):
+    def record(self, resume_filename=None):
         try:
-            self.filename = f"demos/demofile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            self.filename = resume_filename or f"demos/demofile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             demofile = None
             sample = None
             connect()
-            (mlvl_id, room_idx) = get_room()
-            (mrea_id, room_name, base_object_count) = MLVL_ID_ROOM_IDX_TO_ROOM_INFO[(mlvl_id, room_idx)]
-            world_name = MLVL_TO_WORLD_NAME[mlvl_id]
-            demofile = Demofile(self.sample_rate_hz.get(), self.filename, world_name, room_name)
+            room = catalog().by_index(*get_room())
+            world_name = room.world_name
+            room_name = room.name
+            if resume_filename:
+                demofile = Demofile.load(self.sample_rate_hz.get(), resume_filename)
+                if (demofile.world_name, demofile.room_name) != (world_name, room_name):
+                    raise Exception(f"\"{resume_filename}\" was recorded in {demofile.world_name}:{demofile.room_name}")
+
+                # Segments recorded at different rates play back with visibly different smoothness
+                recorded_sample_rate = demofile.recorded_sample_rate
+                if recorded_sample_rate and abs(recorded_sample_rate - self.sample_rate_hz.get()) > 0.1*recorded_sample_rate:
+                    messagebox.showwarning(
+                        "Sample Rate Mismatch",
+                        f"\"{resume_filename}\" appears to have been recorded at {recorded_sample_rate:.1f} Hz, but {self.sample_rate_hz.get()} Hz is selected",
+                    )
+            elif self.degrade_when_full.get():
+                demofile = BudgetedDemofile(self.sample_rate_hz.get(), self.filename, world_name, room_name, room.object_budget)
+            else:
+                demofile = Demofile(self.sample_rate_hz.get(), self.filename, world_name, room_name)
+
+            resampler = Resampler(self.sample_rate_hz.get()) if self.resample_samples.get() else None
 
             while self.recording:
                 start_time = time()
                 sample = take_sample()
 
-                demofile.process_sample(sample)
+                # One sample can become several after resampling, check the budget after each
+                for grid_sample in resampler.feed(sample) if resampler else [sample]:
+                    demofile.process_sample(grid_sample)
 
-                objects_remaining = 1024 - (base_object_count + demofile.object_count() + OBJECT_COUNT_OVERHEAD)
-                objects_remaining = max(0, objects_remaining)
-                self.object_count_var.set(f"Objects Remaining: {objects_remaining}")
+                    objects_remaining = room.object_budget - demofile.object_count()
+                    objects_remaining = max(0, objects_remaining)
+                    self.object_count_var.set(f"Objects Remaining: {objects_remaining}")
 
-                if objects_remaining <= 0:
-                    raise Exception("Ran out of objects")
+                    if objects_remaining <= 0:
+                        raise Exception("Ran out of objects")
 
                 elapsed_time = time() - start_time
                 remaining_time = max(0, (1/self.sample_rate_hz.get()) - elapsed_time)
@@ -77,9 +108,12 @@ class MetroidPrimeDemofileGUI:
             disconnect()
             self.recording = False
             if demofile and sample:
-                demofile.commit(sample)
+                if self.compact_output.get():
+                    demofile.commit(sample, compact=True, precision=COMPACT_FLOAT_PRECISION, compression=COMPACT_COMPRESSION)
+                else:
+                    demofile.commit(sample)
 
-    def start_recording(self):
+    def start_recording(self, resume_filename=None):
         if self.recording:
             return
 
@@ -87,15 +121,27 @@ class MetroidPrimeDemofileGUI:
 
         self.recording_done_var.set("")
         self.start_button.pack_forget()
+        self.resume_button.pack_forget()
 
         self.stop_button.pack(pady=5)
 
-        threading.Thread(target=self.record).start()
+        threading.Thread(target=self.record, args=(resume_filename,)).start()
+
+    def resume_recording(self):
+        # The simplified encoder can't pick up where a saved demofile left off
+        if self.degrade_when_full.get():
+            messagebox.showerror("Unable to Resume", "Resuming a recording can't be combined with \"Simplify Instead of Stopping When Out of Objects\"")
+            return
+
+        filename = filedialog.askopenfilename(initialdir="demos", filetypes=[("Demofile", "*.json")])
+        if filename:
+            self.start_recording(filename)
 
     def stop_recording(self):
         self.recording = False
         self.stop_button.pack_forget()
         self.start_button.pack(pady=5)
+        self.resume_button.pack(pady=5)
         self.recording_done_var.set(f"Saved to \"{self.filename}\"")
         self.filename = None
 
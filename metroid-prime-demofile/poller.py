@@ -0,0 +1,166 @@
+import asyncio
+
+from dolphin import (
+    is_connected,
+    read_fields,
+    rotation_from_vector,
+    GAME_TIME,
+    PLAYER_POS_X,
+    PLAYER_POS_Y,
+    PLAYER_POS_Z,
+    PLAYER_ROT_X,
+    PLAYER_ROT_Y,
+    WORLD_MLVL,
+    WORLD_AREA_IDX,
+)
+
+# Watches due within this many seconds of each other are read in the same tick
+TICK_SLACK = 0.005
+
+# Values kept for a consumer which isn't keeping up, older ones are dropped
+STREAM_BUFFER_SIZE = 64
+
+_STREAM_END = object()
+
+class Watch:
+    def __init__(self, fields, rate_hz, transform=None, changes_only=False):
+        self.fields = fields
+        self.rate_hz = rate_hz
+        self.transform = transform
+        self.changes_only = changes_only
+
+        # Read on the poller's first tick
+        self.next_due = 0
+        self.last_value = None
+        self._queues = list()
+
+    def stream(self):
+        # Subscribe now rather than on the first iteration, so nothing published
+        # between asking for the stream and starting to read it is lost
+        queue = asyncio.Queue(maxsize=STREAM_BUFFER_SIZE)
+        self._queues.append(queue)
+        return self._drain(queue)
+
+    async def _drain(self, queue):
+        try:
+            while True:
+                value = await queue.get()
+                if value is _STREAM_END:
+                    return
+                if isinstance(value, Exception):
+                    raise value
+                yield value
+        finally:
+            self._queues.remove(queue)
+
+    def _publish(self, value):
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(value)
+
+    def _update(self, values):
+        value = self.transform(*values) if self.transform else values[0]
+
+        # Transforms return None for values which shouldn't be passed on
+        if value is None:
+            return
+        if self.changes_only and value == self.last_value:
+            return
+
+        self.last_value = value
+        self._publish(value)
+
+class Poller:
+    def __init__(self):
+        self.watches = list()
+        self.running = False
+
+    def watch(self, fields, rate_hz, transform=None, changes_only=False):
+        watch = Watch(fields, rate_hz, transform, changes_only)
+        self.watches.append(watch)
+        return watch
+
+    def watch_address(self, address, kind, rate_hz, **kwargs):
+        return self.watch([((address,), kind)], rate_hz, **kwargs)
+
+    def watch_chain(self, chain, kind, rate_hz, **kwargs):
+        return self.watch([(chain, kind)], rate_hz, **kwargs)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self.running = True
+
+        try:
+            # Checked once up front, after that a lost connection makes read_fields fail
+            if not await asyncio.to_thread(is_connected):
+                raise Exception("Not connected to Dolphin")
+
+            while self.running and self.watches:
+                now = loop.time()
+                due = [watch for watch in self.watches if watch.next_due <= now + TICK_SLACK]
+
+                if due:
+                    # One batch of reads per tick, no matter how many watches are due
+                    fields = [field for watch in due for field in watch.fields]
+                    values = await asyncio.to_thread(read_fields, fields)
+
+                    for watch in due:
+                        count = len(watch.fields)
+                        watch._update(values[:count])
+                        values = values[count:]
+
+                        # Don't try to catch up on ticks missed while Dolphin was slow
+                        watch.next_due += 1/watch.rate_hz
+                        if watch.next_due < now:
+                            watch.next_due = now + 1/watch.rate_hz
+
+                next_due = min(watch.next_due for watch in self.watches)
+                await asyncio.sleep(max(0, next_due - loop.time()))
+        except Exception as e:
+            for watch in self.watches:
+                watch._publish(e)
+            raise
+        finally:
+            self.running = False
+            for watch in self.watches:
+                watch._publish(_STREAM_END)
+
+    def stop(self):
+        self.running = False
+
+def _player_sample(time, x, y, z, rot_x, rot_y):
+    pos = (x, y, z)
+
+    # Skip samples taken while the game isn't running, see take_sample()
+    if (time < 0.1) or abs(sum(pos)) < 0.01:
+        return None
+
+    return (time, pos, rotation_from_vector(rot_x, rot_y))
+
+def watch_samples(poller, rate_hz):
+    fields = [
+        (GAME_TIME, "double"),
+        (PLAYER_POS_X, "float"),
+        (PLAYER_POS_Y, "float"),
+        (PLAYER_POS_Z, "float"),
+        (PLAYER_ROT_X, "float"),
+        (PLAYER_ROT_Y, "float"),
+    ]
+    return poller.watch(fields, rate_hz, transform=_player_sample)
+
+def watch_game_time(poller, rate_hz):
+    return poller.watch_chain(GAME_TIME, "double", rate_hz)
+
+def watch_room(poller, rate_hz):
+    fields = [
+        (WORLD_MLVL, "word"),
+        (WORLD_AREA_IDX, "word"),
+    ]
+    return poller.watch(fields, rate_hz, transform=lambda mlvl_id, room_idx: (mlvl_id, room_idx), changes_only=True)
+
+async def encode_samples(watch, demofile):
+    sample = None
+    async for sample in watch.stream():
+        demofile.process_sample(sample)
+    return sample
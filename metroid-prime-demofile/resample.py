@@ -0,0 +1,61 @@
+from demofile import calculate_rotation
+
+# Gaps in game time longer than this many grid steps are treated as lag
+MAX_GAP_STEPS = 4
+
+def _lerp(a, b, t):
+    return a + (b - a)*t
+
+def interpolate_sample(s1, s2, time):
+    (t1, pos1, rot1) = s1
+    (t2, pos2, rot2) = s2
+    t = (time - t1)/(t2 - t1)
+
+    pos = tuple(_lerp(a, b, t) for (a, b) in zip(pos1, pos2))
+
+    # Turn the short way around, the same way calculate_rotation does
+    rot = (rot1 + calculate_rotation(rot1, rot2)*t) % 360
+
+    return (time, pos, rot)
+
+class Resampler:
+    # Turns samples taken at wall-clock intervals into samples on a uniform game-time grid
+    def __init__(self, sample_rate):
+        self.step = 1/sample_rate
+        self.last_sample = None
+        self.start_time = None
+        self.next_step = None
+
+    def feed(self, sample):
+        time = sample[0]
+
+        if self.last_sample is None:
+            self.last_sample = sample
+            self.start_time = time
+            self.next_step = 1
+            return [sample]
+
+        last_time = self.last_sample[0]
+
+        # The game is paused or reloaded, nothing new to interpolate towards
+        if time <= last_time:
+            return []
+
+        if time - last_time > MAX_GAP_STEPS*self.step:
+            # A lag spike, interpolating across it would only fill it with a row of
+            # collinear waypoints. Skip ahead so it's bridged by the one grid point
+            # closest to where the gap ends.
+            self.next_step = max(self.next_step, int((time - self.start_time)/self.step))
+
+        # Grid times are counted from the start so rounding errors don't build up
+        samples = list()
+        while (grid_time := self.start_time + self.next_step*self.step) <= time:
+            samples.append(interpolate_sample(self.last_sample, sample, grid_time))
+            self.next_step += 1
+
+        self.last_sample = sample
+        return samples
+
+def resample(samples, sample_rate):
+    resampler = Resampler(sample_rate)
+    return [grid_sample for sample in samples for grid_sample in resampler.feed(sample)]
@@ -1,300 +1,118 @@
-MLVL_TO_WORLD_NAME = {
-    0x158EFE17: "Frigate Orpheon",
-    0x83F6FF6F: "Chozo Ruins",
-    0xA8BE6291: "Phendrana Drifts",
-    0x39F2DE28: "Tallon Overworld",
-    0xB1AC4D65: "Phazon Mines",
-    0x3EF8237C: "Magmoor Caverns",
-    0xC13B09D1: "Impact Crater",
-    0x13D79165: "End Cinema",
-}
+from functools import cache
+from typing import NamedTuple
+import os
+import csv
 
-WORLD_NAME_TO_MLVL = {
-    "Frigate Orpheon": 0x158EFE17,
-    "Chozo Ruins": 0x83F6FF6F,
-    "Phendrana Drifts": 0xA8BE6291,
-    "Tallon Overworld": 0x39F2DE28,
-    "Phazon Mines": 0xB1AC4D65,
-    "Magmoor Caverns": 0x3EF8237C,
-    "Impact Crater": 0xC13B09D1,
-    "End Cinema": 0x13D79165,
-}
+ROOMS_DATA_FILEPATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rooms.csv")
 
-MLVL_ID_ROOM_IDX_TO_ROOM_INFO = {
-    (0x13D79165, 0x0 ): (0xB4B41C48, "End Cinema"                         , 357 ),
-    (0x158EFE17, 0x0 ): (0xD1241219, "Exterior Docking Hangar"            , 1006),
-    (0x158EFE17, 0x1 ): (0x7640602 , "Air Lock"                           , 137 ),
-    (0x158EFE17, 0x2 ): (0x624F493A, "Deck Alpha Access Hall"             , 89  ),
-    (0x158EFE17, 0x3 ): (0xC8971E99, "Deck Alpha Mech Shaft"              , 19  ),
-    (0x158EFE17, 0x4 ): (0x20E48216, "Emergency Evacuation Area"          , 265 ),
-    (0x158EFE17, 0x5 ): (0xAE1EC8BD, "Connection Elevator to Deck Alpha"  , 308 ),
-    (0x158EFE17, 0x6 ): (0xEE21C026, "Deck Alpha Umbilical Hall"          , 67  ),
-    (0x158EFE17, 0x7 ): (0xC5DE3C06, "Biotech Research Area 2"            , 279 ),
-    (0x158EFE17, 0x8 ): (0xCDE604F0, "Map Facility"                       , 181 ),
-    (0x158EFE17, 0x9 ): (0x1055715C, "Main Ventilation Shaft Section F"   , 39  ),
-    (0x158EFE17, 0xA ): (0x31C44B23, "Connection Elevator to Deck Beta"   , 105 ),
-    (0x158EFE17, 0xB ): (0x292DDC1C, "Main Ventilation Shaft Section E"   , 77  ),
-    (0x158EFE17, 0xC ): (0xA8813FB6, "Deck Beta Conduit Hall"             , 150 ),
-    (0x158EFE17, 0xD ): (0x3E05B8DC, "Main Ventilation Shaft Section D"   , 39  ),
-    (0x158EFE17, 0xE ): (0x85578E54, "Biotech Research Area 1"            , 232 ),
-    (0x158EFE17, 0xF ): (0x5BDC869C, "Main Ventilation Shaft Section C"   , 143 ),
-    (0x158EFE17, 0x10): (0x49C59925, "Deck Beta Security Hall"            , 194 ),
-    (0x158EFE17, 0xA ): (0x6ED3231B, "Connection Elevator to Deck Beta"   , 206 ),
-    (0x158EFE17, 0x12): (0x93500E4 , "Subventilation Shaft Section A"     , 204 ),
-    (0x158EFE17, 0x13): (0x4CF4E25C, "Main Ventilation Shaft Section B"   , 115 ),
-    (0x158EFE17, 0x14): (0xD16B26D0, "Biohazard Containment"              , 306 ),
-    (0x158EFE17, 0x15): (0xE667B605, "Deck Gamma Monitor Hall"            , 227 ),
-    (0x158EFE17, 0x16): (0xC0BBB28A, "Subventilation Shaft Section B"     , 200 ),
-    (0x158EFE17, 0x17): (0x758C4F1C, "Main Ventilation Shaft Section A"   , 105 ),
-    (0x158EFE17, 0x18): (0x2CA2A263, "Deck Beta Transit Hall"             , 61  ),
-    (0x158EFE17, 0x19): (0x87452DC1, "Reactor Core"                       , 304 ),
-    (0x158EFE17, 0x1A): (0x6FF0FD62, "Cargo Freight Lift to Deck Gamma"   , 402 ),
-    (0x158EFE17, 0x1B): (0x3EA190EE, "Reactor Core Entrance"              , 216 ),
-    (0x83F6FF6F, 0x0 ): (0x3E6B2BB7, "Transport to Tallon Overworld North", 77  ),
-    (0x83F6FF6F, 0x1 ): (0xB7F1952A, "Ruins Entrance"                     , 102 ),
-    (0x83F6FF6F, 0x2 ): (0xD5CDB809, "Main Plaza"                         , 545 ),
-    (0x83F6FF6F, 0x3 ): (0x560DBE38, "Ruined Fountain Access"             , 81  ),
-    (0x83F6FF6F, 0x4 ): (0xDF746AE0, "Ruined Shrine Access"               , 69  ),
-    (0x83F6FF6F, 0x5 ): (0x92D89FD , "Nursery Access"                     , 74  ),
-    (0x83F6FF6F, 0x6 ): (0x53359457, "Plaza Access"                       , 89  ),
-    (0x83F6FF6F, 0x7 ): (0x2B3F1CEE, "Piston Tunnel"                      , 99  ),
-    (0x83F6FF6F, 0x8 ): (0x165A4DE9, "Ruined Fountain"                    , 207 ),
-    (0x83F6FF6F, 0x9 ): (0x3C785450, "Ruined Shrine"                      , 512 ),
-    (0x83F6FF6F, 0xA ): (0xCB1E8A0B, "Eyon Tunnel"                        , 28  ),
-    (0x83F6FF6F, 0xB ): (0xEF069019, "Vault"                              , 140 ),
-    (0x83F6FF6F, 0xC ): (0x3F04F304, "Training Chamber"                   , 365 ),
-    (0x83F6FF6F, 0xD ): (0x870B0525, "Arboretum Access"                   , 89  ),
-    (0x83F6FF6F, 0xE ): (0x282B16B4, "Meditation Fountain"                , 127 ),
-    (0x83F6FF6F, 0xF ): (0x59E0184E, "Tower of Light Access"              , 29  ),
-    (0x83F6FF6F, 0x10): (0xC2576E4D, "Ruined Nursery"                     , 271 ),
-    (0x83F6FF6F, 0x11): (0xA5089191, "Vault Access"                       , 64  ),
-    (0x83F6FF6F, 0x12): (0x18D186BB, "Training Chamber Access"            , 76  ),
-    (0x83F6FF6F, 0x13): (0x18AB6106, "Arboretum"                          , 425 ),
-    (0x83F6FF6F, 0x14): (0x491BFABA, "Magma Pool"                         , 195 ),
-    (0x83F6FF6F, 0x15): (0xD72F1F7 , "Tower of Light"                     , 635 ),
-    (0x83F6FF6F, 0x16): (0x1D5E482C, "Save Station 1"                     , 94  ),
-    (0x83F6FF6F, 0x17): (0x46295CA0, "North Atrium"                       , 124 ),
-    (0x83F6FF6F, 0x18): (0x8316EDF5, "Transport to Magmoor Caverns North" , 102 ),
-    (0x83F6FF6F, 0x19): (0x3D238FCD, "Sunchamber Lobby"                   , 39  ),
-    (0x83F6FF6F, 0x1A): (0x95F2019E, "Gathering Hall Access"              , 68  ),
-    (0x83F6FF6F, 0x1B): (0x11BD63B7, "Tower Chamber"                      , 67  ),
-    (0x83F6FF6F, 0x1C): (0xE34FD92B, "Ruined Gallery"                     , 260 ),
-    (0x83F6FF6F, 0x1D): (0xDE161372, "Sun Tower"                          , 344 ),
-    (0x83F6FF6F, 0x1E): (0x3AD2120F, "Transport Access North"             , 180 ),
-    (0x83F6FF6F, 0x1F): (0x54C40995, "Sunchamber Access"                  , 72  ),
-    (0x83F6FF6F, 0x20): (0x47E73BC5, "Gathering Hall"                     , 424 ),
-    (0x83F6FF6F, 0x21): (0xEA8A4073, "Totem Access"                       , 106 ),
-    (0x83F6FF6F, 0x22): (0x1A5B2E16, "Map Station"                        , 78  ),
-    (0x83F6FF6F, 0x23): (0x41CC90EC, "Sun Tower Access"                   , 130 ),
-    (0x83F6FF6F, 0x24): (0xC8309DF6, "Hive Totem"                         , 374 ),
-    (0x83F6FF6F, 0x25): (0x9A0A03EB, "Sunchamber"                         , 949 ),
-    (0x83F6FF6F, 0x26): (0xEEEC837D, "Watery Hall Access"                 , 160 ),
-    (0x83F6FF6F, 0x27): (0xF7D8954E, "Save Station 2"                     , 92  ),
-    (0x83F6FF6F, 0x28): (0x713600E3, "East Atrium"                        , 119 ),
-    (0x83F6FF6F, 0x29): (0x492CBF4A, "Watery Hall"                        , 401 ),
-    (0x83F6FF6F, 0x2A): (0x463D0D2E, "Energy Core Access"                 , 82  ),
-    (0x83F6FF6F, 0x2B): (0xF403B07 , "Dynamo Access"                      , 35  ),
-    (0x83F6FF6F, 0x2C): (0xC9D52BBC, "Energy Core"                        , 383 ),
-    (0x83F6FF6F, 0x2D): (0x4D6C285 , "Dynamo"                             , 131 ),
-    (0x83F6FF6F, 0x2E): (0xEF7EB590, "Burn Dome Access"                   , 56  ),
-    (0x83F6FF6F, 0x2F): (0xC2715A58, "West Furnace Access"                , 31  ),
-    (0x83F6FF6F, 0x30): (0x4148F7B0, "Burn Dome"                          , 400 ),
-    (0x83F6FF6F, 0x31): (0x2E318473, "Furnace"                            , 602 ),
-    (0x83F6FF6F, 0x32): (0x44E528F6, "East Furnace Access"                , 35  ),
-    (0x83F6FF6F, 0x33): (0xD9E78EB0, "Crossway Access West"               , 85  ),
-    (0x83F6FF6F, 0x34): (0xFB54A0CB, "Hall of the Elders"                 , 624 ),
-    (0x83F6FF6F, 0x35): (0x13FFF119, "Crossway"                           , 268 ),
-    (0x83F6FF6F, 0x36): (0x9D516D9D, "Reflecting Pool Access"             , 25  ),
-    (0x83F6FF6F, 0x37): (0xE1CE5BD1, "Elder Hall Access"                  , 65  ),
-    (0x83F6FF6F, 0x38): (0x675A297F, "Crossway Access South"              , 74  ),
-    (0x83F6FF6F, 0x39): (0xE1981EFC, "Elder Chamber"                      , 71  ),
-    (0x83F6FF6F, 0x3A): (0x361ECAAC, "Reflecting Pool"                    , 193 ),
-    (0x83F6FF6F, 0x3B): (0x188A23AF, "Save Station 3"                     , 124 ),
-    (0x83F6FF6F, 0x3C): (0xA2F90C53, "Transport Access South"             , 39  ),
-    (0x83F6FF6F, 0x3D): (0xAFEFE677, "Antechamber"                        , 84  ),
-    (0x83F6FF6F, 0x3E): (0xA5FA69A1, "Transport to Tallon Overworld East" , 77  ),
-    (0x83F6FF6F, 0x3F): (0x236E1B0F, "Transport to Tallon Overworld South", 79  ),
-    (0xA8BE6291, 0x0 ): (0xC00E3781, "Transport to Magmoor Caverns West"  , 96  ),
-    (0xA8BE6291, 0x1 ): (0xC4107CD7, "Shoreline Entrance"                 , 181 ),
-    (0xA8BE6291, 0x2 ): (0xF7285979, "Phendrana Shorelines"               , 434 ),
-    (0xA8BE6291, 0x3 ): (0x85D9F399, "Temple Entryway"                    , 160 ),
-    (0xA8BE6291, 0x4 ): (0x581699D , "Save Station B"                     , 97  ),
-    (0xA8BE6291, 0x5 ): (0x3C13643A, "Ruins Entryway"                     , 183 ),
-    (0xA8BE6291, 0x6 ): (0xC8115292, "Plaza Walkway"                      , 159 ),
-    (0xA8BE6291, 0x7 ): (0x4E85203C, "Ice Ruins Access"                   , 149 ),
-    (0xA8BE6291, 0x8 ): (0x6655F51E, "Chozo Ice Temple"                   , 356 ),
-    (0xA8BE6291, 0x9 ): (0xB33A0620, "Ice Ruins West"                     , 363 ),
-    (0xA8BE6291, 0xA ): (0xDAFCC26F, "Ice Ruins East"                     , 280 ),
-    (0xA8BE6291, 0xB ): (0xEF674B4C, "Chapel Tunnel"                      , 107 ),
-    (0xA8BE6291, 0xC ): (0xCFB8ABD1, "Courtyard Entryway"                 , 103 ),
-    (0xA8BE6291, 0xD ): (0x34D8137 , "Canyon Entryway"                    , 107 ),
-    (0xA8BE6291, 0xE ): (0x40C548E9, "Chapel of the Elders"               , 378 ),
-    (0xA8BE6291, 0xF ): (0x1921876D, "Ruined Courtyard"                   , 515 ),
-    (0xA8BE6291, 0x10): (0xA20A7455, "Phendrana Canyon"                   , 449 ),
-    (0xA8BE6291, 0x11): (0x5694A06B, "Save Station A"                     , 90  ),
-    (0xA8BE6291, 0x12): (0xD341D2DB, "Specimen Storage"                   , 92  ),
-    (0xA8BE6291, 0x13): (0xEAB320CF, "Quarantine Access"                  , 166 ),
-    (0xA8BE6291, 0x14): (0xB51FCE29, "Research Entrance"                  , 410 ),
-    (0xA8BE6291, 0x15): (0x5E1962E , "North Quarantine Tunnel"            , 85  ),
-    (0xA8BE6291, 0x16): (0x83151B33, "Map Station"                        , 77  ),
-    (0xA8BE6291, 0x17): (0x3947E047, "Hydra Lab Entryway"                 , 63  ),
-    (0xA8BE6291, 0x18): (0x70181194, "Quarantine Cave"                    , 608 ),
-    (0xA8BE6291, 0x19): (0x43E4CC25, "Research Lab Hydra"                 , 603 ),
-    (0xA8BE6291, 0x1A): (0x35FDAD  , "South Quarantine Tunnel"            , 129 ),
-    (0xA8BE6291, 0x1B): (0x2191A05D, "Quarantine Monitor"                 , 29  ),
-    (0xA8BE6291, 0x1C): (0x37BBB33C, "Observatory Access"                 , 226 ),
-    (0xA8BE6291, 0x1D): (0xDD0B0739, "Transport to Magmoor Caverns South" , 125 ),
-    (0xA8BE6291, 0x1E): (0x3FB4A34E, "Observatory"                        , 661 ),
-    (0xA8BE6291, 0x1F): (0xD695B958, "Transport Access"                   , 101 ),
-    (0xA8BE6291, 0x20): (0x1E48B18F, "West Tower Entrance"                , 98  ),
-    (0xA8BE6291, 0x21): (0x715C31EE, "Save Station D"                     , 95  ),
-    (0xA8BE6291, 0x22): (0xD79EE805, "Frozen Pike"                        , 276 ),
-    (0xA8BE6291, 0x23): (0xD79D6B9F, "West Tower"                         , 95  ),
-    (0xA8BE6291, 0x24): (0x760E731A, "Pike Access"                        , 39  ),
-    (0xA8BE6291, 0x25): (0x39C70FB9, "Frost Cave Access"                  , 154 ),
-    (0xA8BE6291, 0x26): (0x20EA1D30, "Hunter Cave Access"                 , 99  ),
-    (0xA8BE6291, 0x27): (0xB3C33249, "Control Tower"                      , 622 ),
-    (0xA8BE6291, 0x28): (0xA49B2544, "Research Core"                      , 533 ),
-    (0xA8BE6291, 0x29): (0x4C6F7773, "Frost Cave"                         , 281 ),
-    (0xA8BE6291, 0x2A): (0x1EC7951A, "Hunter Cave"                        , 304 ),
-    (0xA8BE6291, 0x2B): (0x51091931, "East Tower"                         , 81  ),
-    (0xA8BE6291, 0x2C): (0xD8E905DD, "Research Core Access"               , 135 ),
-    (0xA8BE6291, 0x2D): (0xCEDDBA38, "Save Station C"                     , 100 ),
-    (0xA8BE6291, 0x2E): (0x253E76B3, "Upper Edge Tunnel"                  , 56  ),
-    (0xA8BE6291, 0x2F): (0x53801084, "Lower Edge Tunnel"                  , 72  ),
-    (0xA8BE6291, 0x30): (0xCA6CC052, "Chamber Access"                     , 58  ),
-    (0xA8BE6291, 0x31): (0x89D7A0A6, "Lake Tunnel"                        , 58  ),
-    (0xA8BE6291, 0x32): (0x98DCC321, "Aether Lab Entryway"                , 59  ),
-    (0xA8BE6291, 0x33): (0x21B4BFF6, "Research Lab Aether"                , 625 ),
-    (0xA8BE6291, 0x34): (0x54DEF128, "Phendrana's Edge"                   , 143 ),
-    (0xA8BE6291, 0x35): (0x49175472, "Gravity Chamber"                    , 305 ),
-    (0xA8BE6291, 0x36): (0xF7C84340, "Storage Cave"                       , 71  ),
-    (0xA8BE6291, 0x37): (0x3C9490E5, "Security Cave"                      , 23  ),
-    (0x39F2DE28, 0x0 ): (0xB2701146, "Landing Site"                       , 418 ),
-    (0x39F2DE28, 0x1 ): (0x7B143499, "Gully"                              , 114 ),
-    (0x39F2DE28, 0x2 ): (0xEE209548, "Canyon Cavern"                      , 97  ),
-    (0x39F2DE28, 0x3 ): (0x5B4E38F5, "Temple Hall"                        , 71  ),
-    (0x39F2DE28, 0x4 ): (0xC44E7A07, "Alcove"                             , 80  ),
-    (0x39F2DE28, 0x5 ): (0xE76AD711, "Waterfall Cavern"                   , 126 ),
-    (0x39F2DE28, 0x6 ): (0x2043C96E, "Tallon Canyon"                      , 475 ),
-    (0x39F2DE28, 0x7 ): (0xBDB1FCAC, "Temple Security Station"            , 92  ),
-    (0x39F2DE28, 0x8 ): (0xB9ABCD56, "Frigate Crash Site"                 , 394 ),
-    (0x39F2DE28, 0x9 ): (0x13D96D3D, "Transport Tunnel A"                 , 139 ),
-    (0x39F2DE28, 0xA ): (0x404804D9, "Root Tunnel"                        , 136 ),
-    (0x39F2DE28, 0xB ): (0x234762BE, "Temple Lobby"                       , 42  ),
-    (0x39F2DE28, 0xC ): (0xBB158C7E, "Frigate Access Tunnel"              , 31  ),
-    (0x39F2DE28, 0xD ): (0xCEA263E3, "Overgrown Cavern"                   , 54  ),
-    (0x39F2DE28, 0xE ): (0x11A02448, "Transport to Chozo Ruins West"      , 93  ),
-    (0x39F2DE28, 0xF ): (0xBD8C8625, "Root Cave"                          , 301 ),
-    (0x39F2DE28, 0x10): (0x2398E906, "Artifact Temple"                    , 868 ),
-    (0x39F2DE28, 0x11): (0x5E0EE592, "Main Ventilation Shaft Section C"   , 85  ),
-    (0x39F2DE28, 0x12): (0x85CA08AB, "Transport Tunnel C"                 , 181 ),
-    (0x39F2DE28, 0x13): (0xC7E821BA, "Transport Tunnel B"                 , 170 ),
-    (0x39F2DE28, 0x14): (0x24F8AFF3, "Arbor Chamber"                      , 61  ),
-    (0x39F2DE28, 0x15): (0xAFD4E038, "Main Ventilation Shaft Section B"   , 137 ),
-    (0x39F2DE28, 0x16): (0x8A31665E, "Transport to Chozo Ruins East"      , 94  ),
-    (0x39F2DE28, 0x17): (0x15D6FF8B, "Transport to Magmoor Caverns East"  , 97  ),
-    (0x39F2DE28, 0x18): (0x66CBE887, "Main Ventilation Shaft Section A"   , 94  ),
-    (0x39F2DE28, 0x19): (0xEE09629A, "Reactor Core"                       , 165 ),
-    (0x39F2DE28, 0x1A): (0xFB427580, "Reactor Access"                     , 96  ),
-    (0x39F2DE28, 0x1B): (0x37B3AFE6, "Cargo Freight Lift to Deck Gamma"   , 223 ),
-    (0x39F2DE28, 0x1C): (0xF0594C6D, "Savestation"                        , 92  ),
-    (0x39F2DE28, 0x1D): (0x4A96005E, "Deck Beta Transit Hall"             , 39  ),
-    (0x39F2DE28, 0x1E): (0xAC2C58FE, "Biohazard Containment"              , 624 ),
-    (0x39F2DE28, 0x1F): (0x76F6E356, "Deck Beta Security Hall"            , 40  ),
-    (0x39F2DE28, 0x20): (0x5F2EB7B6, "Biotech Research Area 1"            , 168 ),
-    (0x39F2DE28, 0x21): (0xC3D44A6E, "Deck Beta Conduit Hall"             , 40  ),
-    (0x39F2DE28, 0x22): (0xE47228EF, "Connection Elevator to Deck Beta"   , 128 ),
-    (0x39F2DE28, 0x23): (0xFFB4A966, "Hydro Access Tunnel"                , 87  ),
-    (0x39F2DE28, 0x24): (0xF47DBE5B, "Great Tree Hall"                    , 388 ),
-    (0x39F2DE28, 0x25): (0xC5D6A597, "Great Tree Chamber"                 , 30  ),
-    (0x39F2DE28, 0x26): (0x1A932F64, "Transport Tunnel D"                 , 142 ),
-    (0x39F2DE28, 0x27): (0xB4FBBEF5, "Life Grove Tunnel"                  , 135 ),
-    (0x39F2DE28, 0x28): (0x9D330A07, "Transport Tunnel E"                 , 95  ),
-    (0x39F2DE28, 0x29): (0xCA514F0 , "Transport to Chozo Ruins South"     , 93  ),
-    (0x39F2DE28, 0x2A): (0x86EB2E02, "Life Grove"                         , 458 ),
-    (0x39F2DE28, 0x2B): (0x7D106670, "Transport to Phazon Mines East"     , 85  ),
-    (0xB1AC4D65, 0x0 ): (0x430E999C, "Transport to Tallon Overworld South", 94  ),
-    (0xB1AC4D65, 0x1 ): (0x68CC7758, "Quarry Access"                      , 119 ),
-    (0xB1AC4D65, 0x2 ): (0x643D038F, "Main Quarry"                        , 613 ),
-    (0xB1AC4D65, 0x3 ): (0x27A391B7, "Waste Disposal"                     , 125 ),
-    (0xB1AC4D65, 0x4 ): (0x361D41B0, "Save Station Mines A"               , 113 ),
-    (0xB1AC4D65, 0x5 ): (0xC7653A92, "Security Access A"                  , 368 ),
-    (0xB1AC4D65, 0x6 ): (0x97D2B2F6, "Ore Processing"                     , 360 ),
-    (0xB1AC4D65, 0x7 ): (0x956F1552, "Mine Security Station"              , 633 ),
-    (0xB1AC4D65, 0x8 ): (0x4346A747, "Research Access"                    , 77  ),
-    (0xB1AC4D65, 0x9 ): (0xE39C342B, "Storage Depot B"                    , 72  ),
-    (0xB1AC4D65, 0xA ): (0x26219C01, "Elevator Access A"                  , 77  ),
-    (0xB1AC4D65, 0xB ): (0xA20201D4, "Security Access B"                  , 143 ),
-    (0xB1AC4D65, 0xC ): (0x35C5D736, "Storage Depot A"                    , 80  ),
-    (0xB1AC4D65, 0xD ): (0x8A97BB54, "Elite Research"                     , 638 ),
-    (0xB1AC4D65, 0xE ): (0x146ED43 , "Elevator A"                         , 139 ),
-    (0xB1AC4D65, 0xF ): (0x8988D1CB, "Elite Control Access"               , 154 ),
-    (0xB1AC4D65, 0x10): (0xC50AF17A, "Elite Control"                      , 593 ),
-    (0xB1AC4D65, 0x11): (0xECEFEA8D, "Maintenance Tunnel"                 , 101 ),
-    (0xB1AC4D65, 0x12): (0x90709AAC, "Ventilation Shaft"                  , 238 ),
-    (0xB1AC4D65, 0x13): (0xAD2E7EB9, "Phazon Processing Center"           , 426 ),
-    (0xB1AC4D65, 0x14): (0x3F375ECC, "Omega Research"                     , 446 ),
-    (0xB1AC4D65, 0x15): (0x42C4AAF1, "Transport Access"                   , 62  ),
-    (0xB1AC4D65, 0x16): (0xED6DE73B, "Processing Center Access"           , 89  ),
-    (0xB1AC4D65, 0x17): (0x198FF5DC, "Map Station Mines"                  , 82  ),
-    (0xB1AC4D65, 0x18): (0xF517A1EA, "Dynamo Access"                      , 157 ),
-    (0xB1AC4D65, 0x19): (0xE2C2CF38, "Transport to Magmoor Caverns South" , 94  ),
-    (0xB1AC4D65, 0x1A): (0x3953C353, "Elite Quarters"                     , 551 ),
-    (0xB1AC4D65, 0x1B): (0xFEA372E2, "Central Dynamo"                     , 639 ),
-    (0xB1AC4D65, 0x1C): (0x71343C3F, "Elite Quarters Access"              , 116 ),
-    (0xB1AC4D65, 0x1D): (0x5ABEEC20, "Quarantine Access A"                , 202 ),
-    (0xB1AC4D65, 0x1E): (0x7BD5E0BB, "Save Station Mines B"               , 90  ),
-    (0xB1AC4D65, 0x1F): (0xBB3AFC4E, "Metroid Quarantine B"               , 365 ),
-    (0xB1AC4D65, 0x20): (0xFB051F5A, "Metroid Quarantine A"               , 640 ),
-    (0xB1AC4D65, 0x21): (0x14530779, "Quarantine Access B"                , 72  ),
-    (0xB1AC4D65, 0x22): (0x66D0D003, "Save Station Mines C"               , 94  ),
-    (0xB1AC4D65, 0x23): (0x3FD9D766, "Elevator Access B"                  , 100 ),
-    (0xB1AC4D65, 0x24): (0xEC47C242, "Fungal Hall B"                      , 187 ),
-    (0xB1AC4D65, 0x25): (0xE87957E0, "Elevator B"                         , 90  ),
-    (0xB1AC4D65, 0x26): (0xB089331E, "Missile Station Mines"              , 82  ),
-    (0xB1AC4D65, 0x27): (0xBBFA4AB3, "Phazon Mining Tunnel"               , 183 ),
-    (0xB1AC4D65, 0x28): (0xDE9D71F5, "Fungal Hall Access"                 , 107 ),
-    (0xB1AC4D65, 0x29): (0xF5277D1 , "Fungal Hall A"                      , 109 ),
-    (0x3EF8237C, 0x0 ): (0x3BEAADC9, "Transport to Chozo Ruins North"     , 93  ),
-    (0x3EF8237C, 0x1 ): (0x6D434F4E, "Burning Trail"                      , 212 ),
-    (0x3EF8237C, 0x2 ): (0x79784D3D, "Lake Tunnel"                        , 113 ),
-    (0x3EF8237C, 0x3 ): (0x9B3E01C , "Save Station Magmoor A"             , 104 ),
-    (0x3EF8237C, 0x4 ): (0xA4719C6A, "Lava Lake"                          , 418 ),
-    (0x3EF8237C, 0x5 ): (0xDA2ECB94, "Pit Tunnel"                         , 175 ),
-    (0x3EF8237C, 0x6 ): (0xBAD9EDBF, "Triclops Pit"                       , 430 ),
-    (0x3EF8237C, 0x7 ): (0xDCC4BCC , "Monitor Tunnel"                     , 110 ),
-    (0x3EF8237C, 0x8 ): (0xADEF843E, "Storage Cavern"                     , 48  ),
-    (0x3EF8237C, 0x9 ): (0xC57A641 , "Monitor Station"                    , 448 ),
-    (0x3EF8237C, 0xA ): (0x47F2C087, "Transport Tunnel A"                 , 121 ),
-    (0x3EF8237C, 0xB ): (0x89A6CB8D, "Warrior Shrine"                     , 69  ),
-    (0x3EF8237C, 0xC ): (0x901040DF, "Shore Tunnel"                       , 124 ),
-    (0x3EF8237C, 0xD ): (0xDCA9A28B, "Transport to Phendrana Drifts North", 96  ),
-    (0x3EF8237C, 0xE ): (0xF5EF1862, "Fiery Shores"                       , 504 ),
-    (0x3EF8237C, 0xF ): (0x3346C676, "Transport Tunnel B"                 , 77  ),
-    (0x3EF8237C, 0x10): (0x4C3D244C, "Transport to Tallon Overworld West" , 126 ),
-    (0x3EF8237C, 0x11): (0xE4A4462E, "Twin Fires Tunnel"                  , 131 ),
-    (0x3EF8237C, 0x12): (0x4C784BEA, "Twin Fires"                         , 385 ),
-    (0x3EF8237C, 0x13): (0xA73BD0E0, "North Core Tunnel"                  , 149 ),
-    (0x3EF8237C, 0x14): (0xC0498676, "Geothermal Core"                    , 573 ),
-    (0x3EF8237C, 0x15): (0x4CC18E5A, "Plasma Processing"                  , 111 ),
-    (0x3EF8237C, 0x16): (0x70D950B8, "South Core Tunnel"                  , 132 ),
-    (0x3EF8237C, 0x17): (0x8ABEB3C3, "Magmoor Workstation"                , 509 ),
-    (0x3EF8237C, 0x18): (0x46D5649 , "Workstation Tunnel"                 , 82  ),
-    (0x3EF8237C, 0x19): (0xD38FD611, "Transport Tunnel C"                 , 100 ),
-    (0x3EF8237C, 0x1A): (0xEF2F1440, "Transport to Phazon Mines West"     , 88  ),
-    (0x3EF8237C, 0x1B): (0xC1AC9233, "Transport to Phendrana Drifts South", 117 ),
-    (0x3EF8237C, 0x1C): (0x7F56D921, "Save Station Magmoor B"             , 104 ),
-    (0xC13B09D1, 0x0 ): (0x93668996, "Crater Entry Point"                 , 143 ),
-    (0xC13B09D1, 0x1 ): (0x49CB2363, "Crater Tunnel A"                    , 80  ),
-    (0xC13B09D1, 0x2 ): (0xBD946AC3, "Phazon Core"                        , 144 ),
-    (0xC13B09D1, 0x3 ): (0x4D446C3F, "Crater Missile Station"             , 84  ),
-    (0xC13B09D1, 0x4 ): (0x32D5A180, "Crater Tunnel B"                    , 131 ),
-    (0xC13B09D1, 0x5 ): (0x67156A0D, "Phazon Infusion Chamber"            , 120 ),
-    (0xC13B09D1, 0x6 ): (0xDADF06C3, "Subchamber One"                     , 147 ),
-    (0xC13B09D1, 0x7 ): (0x749DF46 , "Subchamber Two"                     , 134 ),
-    (0xC13B09D1, 0x8 ): (0x7A3AD91E, "Subchamber Three"                   , 95  ),
-    (0xC13B09D1, 0x9 ): (0xA7AC009B, "Subchamber Four"                    , 95  ),
-    (0xC13B09D1, 0xA ): (0x77714498, "Subchamber Five"                    , 42  ),
-    (0xC13B09D1, 0xB ): (0x1A666C55, "Metroid Prime Lair"                 , 366 ),
-}
+MAX_OBJECT_COUNT = 1024
+OBJECT_COUNT_OVERHEAD = 128
+
+class Room(NamedTuple):
+    mlvl_id: int
+    world_name: str
+    room_idx: int
+    mrea_id: int
+    name: str
+    base_object_count: int
+
+    # How many objects a recording in this room may use
+    object_budget: int
+
+class RoomCatalog:
+    def __init__(self, rooms):
+        self.rooms = list()
+        self._by_index = dict()
+        self._by_mrea = dict()
+        self._by_name = dict()
+        self._world_names = dict()
+        self._mlvl_ids = dict()
+
+        # Collisions are errors in the data, refuse to build rather than silently
+        # letting the later entry win
+        for room in rooms:
+            if self._world_names.setdefault(room.mlvl_id, room.world_name) != room.world_name:
+                raise ValueError(f"MLVL 0x{room.mlvl_id:08X} is named both '{self._world_names[room.mlvl_id]}' and '{room.world_name}'")
+            if self._mlvl_ids.setdefault(room.world_name, room.mlvl_id) != room.mlvl_id:
+                raise ValueError(f"World '{room.world_name}' has MLVLs 0x{self._mlvl_ids[room.world_name]:08X} and 0x{room.mlvl_id:08X}")
+
+            key = (room.mlvl_id, room.room_idx)
+            if key in self._by_index:
+                raise ValueError(f"Duplicate room index {room.world_name}:0x{room.room_idx:X} ('{self._by_index[key].name}' and '{room.name}')")
+            if room.mrea_id in self._by_mrea:
+                raise ValueError(f"Duplicate MREA 0x{room.mrea_id:08X} ('{self._by_mrea[room.mrea_id].name}' and '{room.name}')")
+
+            self.rooms.append(room)
+            self._by_index[key] = room
+            self._by_mrea[room.mrea_id] = room
+
+            # Some worlds really do have two rooms sharing a name, those can
+            # only be resolved by index or MREA
+            self._by_name.setdefault((room.world_name, room.name), list()).append(room)
+
+    @classmethod
+    def from_file(cls, filepath):
+        with open(filepath, 'r', newline='') as file:
+            rows = list(csv.DictReader(file))
+
+        rooms = list()
+        for row in rows:
+            base_object_count = int(row["base_object_count"])
+            rooms.append(
+                Room(
+                    mlvl_id=int(row["mlvl_id"], 16),
+                    world_name=row["world_name"],
+                    room_idx=int(row["room_idx"], 16),
+                    mrea_id=int(row["mrea_id"], 16),
+                    name=row["room_name"],
+                    base_object_count=base_object_count,
+                    object_budget=MAX_OBJECT_COUNT - base_object_count - OBJECT_COUNT_OVERHEAD,
+                )
+            )
+
+        return cls(rooms)
+
+    def __len__(self):
+        return len(self.rooms)
+
+    def __iter__(self):
+        return iter(self.rooms)
+
+    def by_index(self, mlvl_id, room_idx):
+        try:
+            return self._by_index[(mlvl_id, room_idx)]
+        except KeyError:
+            raise KeyError(f"Unknown room 0x{room_idx:X} in MLVL 0x{mlvl_id:08X}") from None
+
+    def by_mrea(self, mrea_id):
+        try:
+            return self._by_mrea[mrea_id]
+        except KeyError:
+            raise KeyError(f"Unknown MREA 0x{mrea_id:08X}") from None
+
+    def by_name(self, world_name, room_name):
+        rooms = self._by_name.get((world_name, room_name))
+        if not rooms:
+            raise KeyError(f"Unknown room '{world_name}:{room_name}'")
+        if len(rooms) > 1:
+            raise ValueError(f"Room name '{world_name}:{room_name}' is ambiguous, look it up by index or MREA instead")
+        return rooms[0]
+
+    def rooms_named(self, world_name, room_name):
+        return list(self._by_name.get((world_name, room_name), ()))
+
+    def world_name(self, mlvl_id):
+        return self._world_names[mlvl_id]
+
+    def mlvl_id(self, world_name):
+        return self._mlvl_ids[world_name]
+
+# Loaded on first use so importing this module costs nothing
+@cache
+def catalog():
+    return RoomCatalog.from_file(ROOMS_DATA_FILEPATH)
+
+if __name__ == "__main__":
+    # Building the catalog validates it
+    rooms = catalog()
+    print(f"'{ROOMS_DATA_FILEPATH}' OK ({len(rooms)} rooms)")
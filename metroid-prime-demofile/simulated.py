@@ -0,0 +1,90 @@
+from time import time
+import math
+import struct
+
+# Where the simulated game keeps the structures dolphin.py reads
+TIME_BASE = 0x80100000
+PLAYER_BASE = 0x80200000
+WORLD_BASE = 0x80300000
+
+# Walk for this many seconds out of every cycle, then stand still
+WALK_TIME = 7
+CYCLE_TIME = 10
+
+class SimulatedDolphin:
+    # Stands in for dolphin_memory_engine, see dolphin.use_backend(). The player
+    # walks around a circle in the given room, pausing once per cycle.
+    def __init__(self, mlvl_id, room_idx, center=(0, 0, 0), radius=10, speed=5, time_scale=1):
+        self.mlvl_id = mlvl_id
+        self.room_idx = room_idx
+        self.center = center
+        self.radius = radius
+        self.speed = speed
+        self.time_scale = time_scale
+
+        self.hooked = False
+        self.hook_time = None
+
+    def hook(self):
+        self.hooked = True
+        self.hook_time = time()
+
+    def un_hook(self):
+        self.hooked = False
+
+    def is_hooked(self):
+        return self.hooked
+
+    def _game_time(self):
+        return 1 + (time() - self.hook_time)*self.time_scale
+
+    def _values(self):
+        game_time = self._game_time()
+
+        cycles, cycle_time = divmod(game_time, CYCLE_TIME)
+        walk_time = cycles*WALK_TIME + min(cycle_time, WALK_TIME)
+        angle = walk_time*self.speed/self.radius
+
+        (cx, cy, cz) = self.center
+        x = cx + self.radius*math.cos(angle)
+        y = cy + self.radius*math.sin(angle)
+
+        # Face along the circle, rotation_from_vector() adds 270 degrees
+        facing = angle + math.pi
+        return [
+            (0x804578CC, ">I", TIME_BASE),
+            (0x80458350, ">I", PLAYER_BASE),
+            (0x8045A1A8 + 0x850, ">I", WORLD_BASE),
+            (TIME_BASE + 0xA0, ">d", game_time),
+            (PLAYER_BASE + 0x40, ">f", x),
+            (PLAYER_BASE + 0x50, ">f", y),
+            (PLAYER_BASE + 0x60, ">f", cz),
+            (PLAYER_BASE + 0x500, ">f", math.cos(facing)),
+            (PLAYER_BASE + 0x510, ">f", math.sin(facing)),
+            (WORLD_BASE + 0x8, ">I", self.mlvl_id),
+            (WORLD_BASE + 0x68, ">I", self.room_idx),
+        ]
+
+    def read_bytes(self, console_address, size):
+        if not self.hooked:
+            raise RuntimeError("Simulated Dolphin isn't hooked")
+
+        # Everything the game doesn't define reads back as zero
+        memory = bytearray(size)
+        for (addr, fmt, value) in self._values():
+            data = struct.pack(fmt, value)
+            start = max(addr, console_address)
+            end = min(addr + len(data), console_address + size)
+            if start < end:
+                memory[start - console_address:end - console_address] = data[start - addr:end - addr]
+
+        return bytes(memory)
+
+    def read_word(self, console_address):
+        return struct.unpack(">I", self.read_bytes(console_address, 4))[0]
+
+    def read_float(self, console_address):
+        return struct.unpack(">f", self.read_bytes(console_address, 4))[0]
+
+    def read_double(self, console_address):
+        return struct.unpack(">d", self.read_bytes(console_address, 8))[0]
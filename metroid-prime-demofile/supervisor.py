@@ -0,0 +1,177 @@
+from time import time, sleep
+from datetime import datetime
+from multiprocessing import Pipe, Process, Event
+from multiprocessing.connection import wait
+import argparse
+import os
+import signal
+
+import dolphin
+from dolphin import connect, disconnect, get_room, take_sample
+from demofile import Demofile
+from budget import FINAL_SAMPLE_OBJECT_COUNT
+from resample import Resampler
+from rooms import catalog
+from simulated import SimulatedDolphin
+
+DEFAULT_SAMPLE_RATE = 10
+
+# The rotate commit() adds to face the start again
+CLOSING_OBJECT_COUNT = 1
+
+def _record_worker(backend, sample_rate, conn, stop_event):
+    # Ctrl+C reaches every worker too, but the coordinator stops them through stop_event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # Each worker is its own process, so it gets its own dolphin_memory_engine hook
+    if backend is not None:
+        dolphin.use_backend(backend)
+
+    try:
+        connect()
+        conn.send(("room", get_room()))
+
+        while not stop_event.is_set():
+            start_time = time()
+            conn.send(("sample", take_sample()))
+
+            elapsed_time = time() - start_time
+            sleep(max(0, (1/sample_rate) - elapsed_time))
+    except Exception as e:
+        conn.send(("error", f"{e}"))
+    finally:
+        disconnect()
+        conn.close()
+
+class Instance:
+    def __init__(self, name, backend, sample_rate, filepath, resample=True):
+        self.name = name
+        self.filepath = filepath
+        self.stop_event = Event()
+        (self.conn, self.worker_conn) = Pipe(duplex=False)
+        self.process = Process(
+            target=_record_worker,
+            args=(backend, sample_rate, self.worker_conn, self.stop_event),
+            daemon=True,
+        )
+        self.sample_rate = sample_rate
+        self.resampler = Resampler(sample_rate) if resample else None
+
+        self.room = None
+        self.demofile = None
+        self.sample = None
+        self.error = None
+
+    def handle(self, message):
+        # A problem with one instance only stops that instance, the others keep recording
+        try:
+            self._handle(message)
+        except Exception as e:
+            self.error = f"{e}"
+            self.stop_event.set()
+            print(f"{self.name}: Recording aborted: {e}")
+
+    def _handle(self, message):
+        (kind, value) = message
+
+        if kind == "room":
+            self.room = catalog().by_index(*value)
+            self.demofile = Demofile(self.sample_rate, self.filepath, self.room.world_name, self.room.name)
+            self.demofile.verbose = False
+        elif kind == "sample":
+            # Samples still in flight after the worker was told to stop are dropped
+            if self.stop_event.is_set():
+                return
+
+            for sample in self.resampler.feed(value) if self.resampler else [value]:
+                self.demofile.process_sample(sample)
+                self.sample = sample
+
+                # Stop while there's still room for another sample and the closing rotate
+                if self.demofile.object_count() + FINAL_SAMPLE_OBJECT_COUNT + CLOSING_OBJECT_COUNT > self.room.object_budget:
+                    print(f"{self.name}: Ran out of objects, stopping")
+                    self.stop_event.set()
+                    break
+        elif kind == "error":
+            self.error = value
+            print(f"{self.name}: Recording aborted: {value}")
+
+    def commit(self):
+        if self.error is not None or not self.demofile or not self.sample:
+            return
+
+        # The last sample is already encoded, so committing only adds the closing rotate
+        if self.demofile.object_count() + CLOSING_OBJECT_COUNT > self.room.object_budget:
+            print(f"{self.name}: Recording doesn't fit in '{self.room.world_name}:{self.room.name}', not saving it")
+            return
+
+        self.demofile.commit(self.sample)
+
+def record_instances(backends, sample_rate, directory, duration=None, resample=True):
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    instances = [
+        Instance(f"instance {i}", backend, sample_rate, os.path.join(directory, f"demofile_{timestamp}_{i}.json"), resample)
+        for (i, backend) in enumerate(backends)
+    ]
+
+    for instance in instances:
+        instance.process.start()
+
+        # Only the worker holds the sending end now, so the pipe closes when it exits
+        instance.worker_conn.close()
+
+    running = {instance.conn: instance for instance in instances}
+    end_time = time() + duration if duration else None
+
+    # Keep draining the pipes after stopping so no worker blocks on a full pipe
+    while running:
+        try:
+            timeout = None if end_time is None else max(0, end_time - time())
+            ready = wait(list(running), timeout)
+        except KeyboardInterrupt:
+            end_time = time()
+            ready = []
+
+        if end_time is not None and time() >= end_time:
+            for instance in instances:
+                instance.stop_event.set()
+            end_time = None
+
+        for conn in ready:
+            instance = running[conn]
+            try:
+                instance.handle(conn.recv())
+            except EOFError:
+                # The worker closed its end of the pipe, it's finished
+                del running[conn]
+
+    for instance in instances:
+        instance.process.join()
+
+    for instance in instances:
+        try:
+            instance.commit()
+        except Exception as e:
+            instance.error = f"{e}"
+            print(f"{instance.name}: Unable to save: {e}")
+
+    return instances
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record a demofile from each of several Dolphin instances at once")
+    parser.add_argument("--sample-rate", type=float, default=DEFAULT_SAMPLE_RATE)
+    parser.add_argument("--duration", type=float, default=None, help="Seconds to record for, defaults to until Ctrl+C")
+    parser.add_argument("--output", default="demos")
+    parser.add_argument("--no-resample", action="store_true", help="Encode samples as they're taken instead of on even game time steps")
+    parser.add_argument("--simulate", type=int, default=0, metavar="N", help="Record N simulated Dolphins. Without this only one real Dolphin is recorded, dolphin_memory_engine can't choose between several")
+    args = parser.parse_args()
+
+    if args.simulate:
+        # Spread the simulated players across the rooms of Chozo Ruins
+        mlvl_id = catalog().mlvl_id("Chozo Ruins")
+        backends = [SimulatedDolphin(mlvl_id, i, radius=5 + i) for i in range(args.simulate)]
+    else:
+        # dolphin_memory_engine hooks whichever Dolphin it finds first
+        backends = [None]
+
+    record_instances(backends, args.sample_rate, args.output, args.duration, not args.no_resample)